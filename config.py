@@ -20,6 +20,13 @@ class Config:
 
     MATCHING_THRESHOLD: float = 0.7
 
+    TOKEN_CACHE_SIZE: int = 10000
+
+    USE_CANDIDATE_INDEX: bool = True
+    CANDIDATE_MIN_SIMILARITY: float = 0.25  # Доля общих триграмм; меньше — выше полнота, но медленнее
+    CANDIDATE_MAX_COUNT: int = 200
+    CANDIDATE_RECALL_REPORT: bool = False  # Сравнение с полным перебором для подбора параметров
+
     SHOP_NAME_COLUMN: str = 'Наименование'
     SHOP_CODE_COLUMN: str = 'Внешний код'
 
@@ -0,0 +1,47 @@
+from collections import defaultdict
+from typing import Dict, List, Set
+
+
+class TrigramIndex:
+    def __init__(self, supplier_data: List[Dict], min_similarity: float, max_candidates: int):
+        """
+        Индекс символьных триграмм по названиям товаров поставщиков.
+
+        :param supplier_data: Список товаров поставщиков.
+        :param min_similarity: Минимальная доля общих триграмм с запросом для попадания в кандидаты.
+        :param max_candidates: Максимальное количество кандидатов на один запрос.
+        """
+        self.supplier_data = supplier_data
+        self.min_similarity = min_similarity
+        self.max_candidates = max_candidates
+        self.postings = defaultdict(list)
+
+        for position, supplier_product in enumerate(supplier_data):
+            for trigram in self._trigrams(supplier_product['Название']):
+                self.postings[trigram].append(position)
+
+    def candidates(self, product_name: str) -> List[Dict]:
+        """Возвращает товары поставщиков, название которых похоже на название товара магазина."""
+        trigrams = self._trigrams(product_name)
+        if not trigrams:
+            return []
+
+        overlap = defaultdict(int)
+        for trigram in trigrams:
+            for position in self.postings.get(trigram, ()):
+                overlap[position] += 1
+
+        min_overlap = self.min_similarity * len(trigrams)
+        positions = [position for position, count in overlap.items() if count >= min_overlap]
+        positions.sort(key=lambda position: overlap[position], reverse=True)
+
+        return [self.supplier_data[position] for position in positions[:self.max_candidates]]
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Разбивает текст на символьные триграммы слов."""
+        trigrams = set()
+        for word in text.lower().split():
+            padded = f' {word} '
+            trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return trigrams
@@ -1,19 +1,23 @@
 import re
+import time
 from typing import List, Dict, Optional
 
 from difflib import SequenceMatcher
 
 from config import Config
+from utils.candidate_index import TrigramIndex
 from utils.dictionary_handler import DictionaryHandler
 from utils.file_reader import FileReader
 from utils.logger import Logger
+from utils.token_cache import TokenCache
 
 
 class DataProcessor:
     def __init__(self):
         self.config = Config()
         self.logger = Logger(__name__)
-        self.dictionary_handler = DictionaryHandler(self.config.DICTIONARY_PATH)
+        self.token_cache = TokenCache(self.config.TOKEN_CACHE_SIZE)
+        self.dictionary_handler = DictionaryHandler(self.config.DICTIONARY_PATH, self.token_cache)
 
     def process_data(self):
         """Основной метод обработки данных."""
@@ -35,6 +39,7 @@ class DataProcessor:
             self.logger.info(f"Обработано {len(supplier_data)} товаров поставщиков.")
 
             matched_products = self._match_products(shop_products, supplier_data)
+            self.logger.info(f"Статистика кэша токенов: {self.token_cache.stats()}")
             self.logger.info("Обработка данных завершена успешно.")
             return matched_products
 
@@ -61,6 +66,16 @@ class DataProcessor:
     def _match_products(self, shop_products: List[Dict], supplier_data: List[Dict]) -> List[Dict]:
         """Сопоставляет товары магазина с товарами поставщиков."""
         matched_products = []
+        candidate_index = None
+        if self.config.USE_CANDIDATE_INDEX:
+            candidate_index = TrigramIndex(
+                supplier_data,
+                self.config.CANDIDATE_MIN_SIMILARITY,
+                self.config.CANDIDATE_MAX_COUNT
+            )
+
+        recall_stats = {'expected': 0, 'found': 0, 'index_time': 0.0, 'full_time': 0.0}
+
         for shop_product in shop_products:
             if 'Наименование' not in shop_product:
                 continue
@@ -69,7 +84,21 @@ class DataProcessor:
             external_code = shop_product.get('Внешний код', 'N/A')
 
             product_dict = self.dictionary_handler.get_dictionary(product_name)
-            matched_suppliers = self._match_suppliers(supplier_data, product_dict, product_name)
+
+            start = time.perf_counter()
+            candidates = candidate_index.candidates(product_name) if candidate_index else supplier_data
+            matched_suppliers = self._match_suppliers(candidates, product_dict, product_name)
+            recall_stats['index_time'] += time.perf_counter() - start
+
+            if candidate_index and self.config.CANDIDATE_RECALL_REPORT:
+                start = time.perf_counter()
+                expected_suppliers = self._match_suppliers(supplier_data, product_dict, product_name)
+                recall_stats['full_time'] += time.perf_counter() - start
+
+                found = {self._supplier_product_key(item) for item in matched_suppliers}
+                expected = {self._supplier_product_key(item) for item in expected_suppliers}
+                recall_stats['expected'] += len(expected)
+                recall_stats['found'] += len(expected & found)
 
             row = {
                 'Наше название': product_name,
@@ -82,8 +111,24 @@ class DataProcessor:
 
             matched_products.append(row)
 
+        if candidate_index and self.config.CANDIDATE_RECALL_REPORT:
+            self._log_recall_report(recall_stats)
+
         return matched_products
 
+    def _log_recall_report(self, recall_stats: Dict):
+        """Логирует полноту и время сопоставления через индекс относительно полного перебора."""
+        recall = recall_stats['found'] / recall_stats['expected'] if recall_stats['expected'] else 1.0
+        self.logger.info(
+            f"Полнота индекса кандидатов: {recall:.2%} "
+            f"({recall_stats['found']} из {recall_stats['expected']} совпадений), "
+            f"время с индексом: {recall_stats['index_time']:.2f} с, "
+            f"время полного перебора: {recall_stats['full_time']:.2f} с.")
+
+    @staticmethod
+    def _supplier_product_key(supplier_product: Dict) -> tuple:
+        return supplier_product['Поставщик'], supplier_product['Название'], supplier_product['Цена']
+
     def _parse_supplier_products(self, supplier_products: List[Dict]) -> List[Dict]:
         supplier_data = []
         unique_products = set()
@@ -277,8 +322,7 @@ class DataProcessor:
 
         return list(unique_suppliers.values())
 
-    @staticmethod
-    def _clean_keywords(product_name: str) -> List[str]:
+    def _clean_keywords(self, product_name: str) -> List[str]:
         """Очищает ключевые слова от лишних символов и разделяет значения по слешу."""
         product_name = re.sub(r'\s\d{4,5}\s*(?:₽|руб|rub|\$)?$', '', product_name)
 
@@ -287,8 +331,8 @@ class DataProcessor:
         parts = re.split(r'[/]', product_name)
         keywords = []
         for part in parts:
-            part = re.sub(r'[^\w\s.+]', '', part)
-            keywords.extend([word.strip().lower() for word in part.split() if word.strip()])
+            cleaned = (self.token_cache.clean_token(word) for word in part.split())
+            keywords.extend([word for word in cleaned if word])
 
         synonyms = {
             'type-c': 'usb-c',
@@ -2,15 +2,16 @@ import json
 import re
 from typing import List
 
+from config import Config
 from utils.logger import Logger
-
-from transliterate import translit
+from utils.token_cache import TokenCache
 
 
 class DictionaryHandler:
-    def __init__(self, file_path):
+    def __init__(self, file_path, token_cache: TokenCache = None):
         self.file_path = file_path
         self.logger = Logger(__name__)
+        self.token_cache = token_cache or TokenCache(Config.TOKEN_CACHE_SIZE)
         self.dictionaries = self._load_dictionaries()
         self.stop_words = {
             "смартфон", "планшет", "телефон", "часы", "watch", "phone",
@@ -39,14 +40,14 @@ class DictionaryHandler:
         """Сохраняет словарь в JSON-файл, предварительно очищая ключевые слова и удаляя стоп-слова."""
         cleaned_dictionaries = {}
         for product_name, keywords in self.dictionaries.items():
-            cleaned_keywords = self._clean_keywords(product_name, self.stop_words)
+            cleaned_keywords = self._clean_keywords(product_name, self.stop_words, self.token_cache)
             cleaned_dictionaries[product_name] = cleaned_keywords
 
         with open(self.file_path, 'w', encoding='utf-8') as file:
             json.dump(cleaned_dictionaries, file, indent=4, ensure_ascii=False)
 
     @staticmethod
-    def _clean_keywords(product_name: str, stop_words: set) -> List[str]:
+    def _clean_keywords(product_name: str, stop_words: set, token_cache: TokenCache) -> List[str]:
         """Очищает ключевые слова от лишних символов и удаляет стоп-слова."""
         product_name = re.sub(r'\s\d{4,5}\s*(?:₽|руб|rub|\$)?$', '', product_name)
 
@@ -55,8 +56,8 @@ class DictionaryHandler:
         parts = re.split(r'[/]', product_name)
         keywords = []
         for part in parts:
-            part = re.sub(r'[^\w\s.+]', '', part)
-            keywords.extend([word.strip().lower() for word in part.split() if word.strip()])
+            cleaned = (token_cache.clean_token(word) for word in part.split())
+            keywords.extend([word for word in cleaned if word])
 
         keywords = [word for word in keywords if word not in stop_words]
 
@@ -73,7 +74,7 @@ class DictionaryHandler:
             self.logger.error(f"Ошибка при добавлении словаря: {e}")
 
     @staticmethod
-    def _add_transliterations(keywords: List[str]) -> List[str]:
+    def _add_transliterations(keywords: List[str], token_cache: TokenCache) -> List[str]:
         """
         Добавляет транслитерации и варианты написания для ключевых слов.
         Транслитерация только для iphone и ipad.
@@ -82,7 +83,7 @@ class DictionaryHandler:
 
         for keyword in keywords:
             if keyword.lower() in {'iphone', 'ipad'}:
-                transliterated = translit(keyword, 'ru', reversed=True)
+                transliterated = token_cache.transliterate(keyword)
                 variations.add(transliterated)
 
         return list(variations)
@@ -90,9 +91,9 @@ class DictionaryHandler:
     def get_dictionary(self, product_name: str) -> List[str]:
         """Возвращает словарь ключевых слов для товара, исключая стоп-слова."""
         if product_name not in self.dictionaries:
-            keywords = self._clean_keywords(product_name, self.stop_words)
+            keywords = self._clean_keywords(product_name, self.stop_words, self.token_cache)
             variations = set(keywords)
-            variations.update(self._add_transliterations(keywords))
+            variations.update(self._add_transliterations(keywords, self.token_cache))
             self.dictionaries[product_name] = list(variations)
             self.save_dictionaries()
 
@@ -0,0 +1,78 @@
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+from transliterate import translit
+
+
+class LRUCache:
+    def __init__(self, max_size: int):
+        """
+        Ограниченный по размеру кэш с вытеснением давно не использованных записей.
+
+        :param max_size: Максимальное количество хранимых записей.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable):
+        """Возвращает значение из кэша или вычисляет и сохраняет его."""
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        self.misses += 1
+        value = compute(key)
+        self._data[key] = value
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, int]:
+        """Возвращает счетчики попаданий и промахов кэша."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._data),
+            'max_size': self.max_size
+        }
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TokenCache:
+    def __init__(self, max_size: int):
+        """
+        Общий кэш очищенных токенов и транслитераций.
+
+        :param max_size: Максимальное количество записей в каждом из кэшей.
+        """
+        self.cleaned = LRUCache(max_size)
+        self.transliterations = LRUCache(max_size)
+
+    def clean_token(self, token: str) -> str:
+        """Очищает слово от лишних символов и приводит к нижнему регистру."""
+        return self.cleaned.get_or_compute(token, self._clean_token)
+
+    def transliterate(self, token: str) -> str:
+        """Возвращает транслитерацию слова."""
+        return self.transliterations.get_or_compute(token, self._transliterate)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Возвращает статистику по каждому из кэшей."""
+        return {
+            'cleaned': self.cleaned.stats(),
+            'transliterations': self.transliterations.stats()
+        }
+
+    @staticmethod
+    def _clean_token(token: str) -> str:
+        return re.sub(r'[^\w\s.+]', '', token).strip().lower()
+
+    @staticmethod
+    def _transliterate(token: str) -> str:
+        return translit(token, 'ru', reversed=True)